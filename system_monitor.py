@@ -11,14 +11,35 @@ Features:
 - Fully commented for learning
 """
 
-from flask import Flask, render_template_string, send_file
-from flask_socketio import SocketIO
-import subprocess, threading, time, csv
+# Optional: with eventlet installed, Flask-SocketIO picks it automatically and serves WebSocket frames
+# from eventlet's server. Patching must run before anything else imports socket/threading/time; the
+# monitor and CSV writer threads (and their Event/Queue waits) then run as cooperative green threads.
+try:
+    import eventlet
+    eventlet.monkey_patch()
+except ImportError:
+    pass
+
+from flask import Flask, request, send_file
+from flask_socketio import SocketIO, emit
+import threading, time, csv, queue, atexit, heapq, os, sys
+import psutil
+from array import array
 from datetime import datetime
 
 # ------------------------- Flask & SocketIO setup -------------------------
 app = Flask(__name__)
-socketio = SocketIO(app)
+
+try:
+    import orjson  # optional: encodes the per-tick packets several times faster than stdlib json
+    class OrjsonModule:
+        """Drop-in for the json module, as python-socketio only needs dumps/loads"""
+        @staticmethod
+        def dumps(obj,**kwargs): return orjson.dumps(obj).decode()
+        loads = staticmethod(orjson.loads)
+    socketio = SocketIO(app,json=OrjsonModule)
+except ImportError:
+    socketio = SocketIO(app)
 
 # ------------------------- HTML + CSS + JS Template -------------------------
 HTML = """
@@ -26,8 +47,8 @@ HTML = """
 <html>
 <head>
     <title>Ultimate System Monitor</title>
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-    <script src="https://cdn.socket.io/4.7.2/socket.io.min.js"></script>
+    <script src="{{ scripts['chart.umd.js'] }}"></script>
+    <script src="{{ scripts['socket.io.min.js'] }}"></script>
     <style>
         body { font-family: Arial; margin:0; background:#f4f4f4; }
         h1 { text-align:center; padding:20px; }
@@ -56,7 +77,7 @@ HTML = """
     <div class="card">RAM Usage<div class="value" id="ram">--%</div></div>
     <div class="card">Disk Usage<div class="value" id="disk">--%</div></div>
     <div class="card">Disk I/O<div class="value" id="diskio">-- B/s</div></div>
-    <div class="card">Network I/O<div class="value" id="netio">-- B</div></div>
+    <div class="card">Network I/O<div class="value" id="netio">-- B/s</div></div>
     <div class="card">Uptime<div class="value" id="uptime">--</div></div>
 </div>
 
@@ -71,7 +92,7 @@ HTML = """
 <h2 style="text-align:center;">Top Processes</h2>
 <div class="table-container">
     <table id="processes">
-        <thead><tr><th>PID</th><th>Name</th></tr></thead>
+        <thead><tr><th>PID</th><th>Name</th><th>CPU %</th><th>Memory (MB)</th></tr></thead>
         <tbody></tbody>
     </table>
 </div>
@@ -101,164 +122,451 @@ HTML = """
     const diskChart = createChart('diskChart','Disk %','orange',diskData);
     const diskioChart = createChart('diskioChart','Disk I/O','purple',diskioData);
     const netioChart = createChart('netioChart','Network I/O','brown',netioData);
+    const charts = [cpuChart, ramChart, diskChart, diskioChart, netioChart];
+    // Sample field plotted by each chart's data array
+    const series = {cpu:cpuData, ram:ramData, disk_max:diskData, diskio:diskioData, recv:netioData};
+
+    // Redraw all charts in one pass per animation frame (paused by the browser while the tab is hidden)
+    let redrawPending = false;
+    function scheduleRedraw(){
+        if(redrawPending) return;
+        redrawPending = true;
+        requestAnimationFrame(()=>{ redrawPending = false; charts.forEach(c=>c.update('none')); });
+    }
+
+    // ------------------------- Cards & Table -------------------------
+    // Elements looked up once at load instead of on every update
+    const cards = {};
+    ['cpu','ram','disk','diskio','netio','uptime'].forEach(id=> cards[id] = document.getElementById(id));
+    const processRows = document.querySelector("#processes tbody");
+
+    function colorClass(val){
+        if(val<60) return 'green';
+        if(val<85) return 'yellow';
+        return 'red';
+    }
+
+    // Shadow of the last value written to each card, so unchanged values never touch the DOM
+    const lastRendered = new Map();
+    function render(id, value, html){
+        if(lastRendered.get(id) === value) return;
+        lastRendered.set(id, value);
+        if(html) cards[id].innerHTML = value; else cards[id].textContent = value;
+    }
 
     // ------------------------- SocketIO -------------------------
     var socket = io();
-    socket.on('update', function(data){
-        function colorClass(val){
-            if(val<60) return 'green';
-            if(val<85) return 'yellow';
-            return 'red';
-        }
+    const state = {};  // every field received so far; the server only sends fields that changed
+
+    // Redraw cards and table from state; delta holds the fields that just changed
+    function renderState(delta){
+        const data = state;
 
         // Update cards with alert colors
-        document.getElementById('cpu').innerHTML = `<span class="${colorClass(data.cpu)}">${data.cpu}%</span>`;
-        document.getElementById('ram').innerHTML = `<span class="${colorClass(data.ram)}">${data.ram}%</span>`;
-        document.getElementById('disk').innerHTML = `<span class="${colorClass(parseFloat(data.disk.split(":")[0]))}">${data.disk}</span>`;
-        document.getElementById('diskio').innerText = data.diskio;
-        document.getElementById('netio').innerText = data.netio;
-        document.getElementById('uptime').innerText = data.uptime;
-
-        // Update process table
-        let tbody = document.querySelector("#processes tbody");
-        tbody.innerHTML = "";
-        data.processes.forEach(p=>{
-            let row = tbody.insertRow();
-            row.insertCell(0).innerText = p.pid;
-            row.insertCell(1).innerText = p.name;
+        render('cpu', `<span class="${colorClass(data.cpu)}">${data.cpu}%</span>`, true);
+        render('ram', `<span class="${colorClass(data.ram)}">${data.ram}%</span>`, true);
+        render('disk', `<span class="${colorClass(data.disk_max)}">${data.disk}</span>`, true);
+        render('diskio', `${data.diskio.toFixed(2)} B/s`);
+        render('netio', `Received: ${data.recv.toFixed(2)} B/s Sent: ${data.sent.toFixed(2)} B/s`);
+        render('uptime', data.uptime);
+
+        // Update process table in place, touching only cells whose text changed
+        if(delta.processes){
+            while(processRows.rows.length > data.processes.length) processRows.deleteRow(-1);
+            data.processes.forEach((p,i)=>{
+                let row = processRows.rows[i] || processRows.insertRow();
+                [p.pid, p.name, p.cpu, p.mem].forEach((v,j)=>{
+                    let cell = row.cells[j] || row.insertCell();
+                    let text = String(v);
+                    if(cell.textContent !== text) cell.textContent = text;
+                });
+            });
+        }
+    }
+
+    // Chart points are kept to 2 decimals: live I/O rates arrive unrounded, and float32 history
+    // widens to long decimals (8.3 -> 8.300000190734863), so both paths go through this
+    const round2 = v => Math.round(v*100)/100;
+
+    // On connect: the server's recent history for every chart (one float32 block per field) plus its latest sample
+    socket.on('snapshot', function(snap){
+        const values = new Float32Array(snap.data);
+        snap.keys.forEach((k,i)=>{
+            const h = Array.from(values.subarray(i*snap.len, (i+1)*snap.len), round2);
+            series[k].fill(0);
+            series[k].splice(series[k].length-h.length, h.length, ...h);
         });
+        if(snap.latest){ Object.assign(state, snap.latest); renderState(snap.latest); }
+        scheduleRedraw();
+    });
 
-        // Update charts
-        cpuData.push(data.cpu); cpuData.shift(); cpuChart.update();
-        ramData.push(data.ram); ramData.shift(); ramChart.update();
-        diskData.push(parseFloat(data.disk.split(":")[0])); diskData.shift(); diskChart.update();
-        diskioData.push(parseFloat(data.diskio.split(" ")[0])); diskioData.shift(); diskioChart.update();
-        netioData.push(parseFloat(data.netio.split(" ")[1])); netioData.shift(); netioChart.update();
+    // Every tick: only the changed fields; every chart advances by one point
+    socket.on('update', function(delta){
+        Object.assign(state, delta);
+        renderState(delta);
+        for(const k in series){ series[k].push(round2(state[k])); series[k].shift(); }
+        scheduleRedraw();
     });
 </script>
 </body>
 </html>
 """
 
+# Front-end libraries: served from static/vendor/ when copies are placed there (no CDN round-trips,
+# long-lived browser cache), otherwise loaded from their CDNs
+VENDOR_DIR = os.path.join(app.static_folder,"vendor")
+CDN_SCRIPTS = {
+    "chart.umd.js": "https://cdn.jsdelivr.net/npm/chart.js",
+    "socket.io.min.js": "https://cdn.socket.io/4.7.2/socket.io.min.js",
+}
+SCRIPTS = {name: f"/static/vendor/{name}" if os.path.isfile(os.path.join(VENDOR_DIR,name)) else url
+           for name,url in CDN_SCRIPTS.items()}
+
+# The page has no per-request values, so compile and render it once instead of on every GET
+INDEX_HTML = app.jinja_env.from_string(HTML).render(scripts=SCRIPTS)
+
 # ------------------------- System Data Functions -------------------------
+MB = 1<<20  # bytes per MiB
+
+# On Linux the system-wide counters are parsed straight from /proc (one read each, no psutil wrapper
+# objects); psutil remains the portable path everywhere else
+LINUX = sys.platform.startswith("linux")
+_cpu_prev = None  # (total, idle) jiffies from the previous /proc/stat read
+
 def get_cpu_usage():
     """Return CPU usage %"""
+    global _cpu_prev
     try:
-        output = subprocess.check_output("wmic cpu get loadpercentage", shell=True)
-        for l in output.decode().splitlines():
-            if l.strip().isdigit(): return int(l.strip())
+        if not LINUX: return psutil.cpu_percent(None)
+        with open("/proc/stat") as f: t=[int(x) for x in f.readline().split()[1:9]]
+        total,idle=sum(t),t[3]+t[4]  # user..steal; idle + iowait count as idle
+        prev=_cpu_prev; _cpu_prev=(total,idle)
+        if prev is None or total<=prev[0]: return 0.0
+        return round(100*(1-(idle-prev[1])/(total-prev[0])),1)
     except: return 0
 
 def get_ram_usage():
     """Return RAM usage %"""
     try:
-        output = subprocess.check_output("wmic OS get FreePhysicalMemory,TotalVisibleMemorySize /Value", shell=True)
-        free = total = 0
-        for l in output.decode().splitlines():
-            if "FreePhysicalMemory" in l: free=int(l.split("=")[1])
-            if "TotalVisibleMemorySize" in l: total=int(l.split("=")[1])
-        return round((1-free/total)*100,2)
+        if not LINUX: return psutil.virtual_memory().percent
+        mem={}
+        with open("/proc/meminfo") as f:
+            for line in f:
+                key,val=line.split(":",1)
+                if key in ("MemTotal","MemAvailable"):
+                    mem[key]=int(val.split()[0])
+                    if len(mem)==2: break
+        return round(100*(1-mem["MemAvailable"]/mem["MemTotal"]),1)
     except: return 0
 
+# Last disk usage result and when it was read; disk % barely moves, so re-read at most every DISK_TTL s
+DISK_TTL = 5.0
+READ_ONLY_FS = {"squashfs","iso9660","udf","cdfs"}  # image/disc filesystems, never written to
+_disk_cache = (0.0, None)
+
 def get_disk_usage():
-    """Return disk usage % per drive"""
+    """Return disk usage as ("C: 45.2%, D: 10.0%", highest %)"""
+    global _disk_cache
+    now=time.monotonic()
+    if _disk_cache[1] is not None and now-_disk_cache[0]<DISK_TTL: return _disk_cache[1]
     try:
-        output = subprocess.check_output("wmic logicaldisk get name,size,freespace", shell=True)
         disks=[]
-        for l in output.decode().splitlines()[1:]:
-            parts=l.split()
-            if len(parts)>=3:
-                name,free,size=parts[0],parts[1],parts[2]
-                usage=round((1-int(free)/int(size))*100,2)
-                disks.append(f"{name}: {usage}%")
-        return ", ".join(disks)
-    except: return "N/A"
+        for part in psutil.disk_partitions():
+            # Read-only mounts and disc images (snap squashfs loops, ISOs, CDs) always report ~100% full
+            if "ro" in part.opts.split(",") or part.fstype in READ_ONLY_FS: continue
+            try: usage=psutil.disk_usage(part.mountpoint).percent
+            except OSError: continue  # e.g. empty card reader / CD drive
+            name=part.mountpoint.rstrip("\\") or part.mountpoint  # "C:\\" -> "C:", "/" stays "/"
+            disks.append((name,usage))
+        _disk_cache=(now,(", ".join(f"{n}: {u}%" for n,u in disks),max((u for _,u in disks),default=0)))
+        return _disk_cache[1]
+    except: return ("N/A",0)
+
+# Previous (timestamp, byte counter) samples, used to turn psutil's cumulative counters into rates
+_io_prev = {}
+
+def _rate(key,total):
+    """Return bytes/sec for a cumulative byte counter since the previous call with the same key"""
+    now=time.monotonic()
+    prev=_io_prev.get(key); _io_prev[key]=(now,total)
+    if prev is None or now<=prev[0]: return 0.0
+    return max(0.0,(total-prev[1])/(now-prev[0]))
 
 def get_disk_io():
     """Return Disk I/O B/s"""
     try:
-        output = subprocess.check_output('typeperf "\\PhysicalDisk(_Total)\\Disk Bytes/sec" -sc 1', shell=True)
-        val=float(output.decode().splitlines()[2].split(',')[1].replace('"',''))
-        return f"{val:.2f} B/s"
-    except: return "0 B/s"
+        if LINUX:
+            # Whole-disk devices only (partitions would count twice), re-listed each call so hot-plugged
+            # disks are picked up; /sys/block spells "/" in names as "!" (cciss/c0d0 -> cciss!c0d0), as psutil maps
+            devices=set(os.listdir("/sys/block"))
+            total=0
+            with open("/proc/diskstats") as f:
+                for line in f:
+                    d=line.split()
+                    if d[2].replace("/","!") in devices: total+=(int(d[5])+int(d[9]))*512  # sectors read + written
+        else:
+            c=psutil.disk_io_counters()
+            total=c.read_bytes+c.write_bytes
+        return _rate('disk',total)
+    except: return 0
 
 def get_net_io():
-    """Return Network I/O: Received/Sent"""
+    """Return Network I/O (received, sent) B/s"""
     try:
-        output = subprocess.check_output("netstat -e", shell=True)
-        lines=output.decode().splitlines()
-        for i,l in enumerate(lines):
-            if "Bytes" in l:
-                vals=lines[i+1].split()
-                return f"Received: {vals[0]} Sent: {vals[1]}"
-        return "0 0"
-    except: return "0 0"
+        if LINUX:
+            recv=sent=0
+            with open("/proc/net/dev") as f:
+                for line in f.readlines()[2:]:  # two header lines
+                    n=line.split(":",1)[1].split()
+                    recv+=int(n[0]); sent+=int(n[8])
+        else:
+            c=psutil.net_io_counters()
+            recv,sent=c.bytes_recv,c.bytes_sent
+        return _rate('recv',recv),_rate('sent',sent)
+    except: return 0,0
+
+# Process handles cached across ticks (PID -> (psutil.Process, name)) so only new PIDs pay the
+# constructor cost; the name is read once on insert since process names rarely change
+_proc_cache = {}
+# Last process list and when it was built; the ranking barely moves tick to tick, so rescan every PROC_TTL s
+PROC_TTL = 5.0
+_proc_list = (0.0, None)
+
+def sync_proc_cache():
+    """Add handles for new PIDs and drop those that exited"""
+    live=set(psutil.pids())
+    for pid in live-_proc_cache.keys():
+        try:
+            # Not primed here: a fresh handle's first cpu_percent(None) in the scan returns 0.0, whereas a
+            # baseline taken milliseconds earlier would turn a single 10 ms clock tick into a bogus 50-500%
+            p=psutil.Process(pid)
+            _proc_cache[pid]=(p,p.name())
+        except psutil.Error: pass
+    for pid in _proc_cache.keys()-live: del _proc_cache[pid]
 
 def get_process_list():
-    """Return top 20 processes"""
-    procs=[]
+    """Return top 20 processes by CPU usage"""
+    global _proc_list
+    now=time.monotonic()
+    if _proc_list[1] is not None and now-_proc_list[0]<PROC_TTL: return _proc_list[1]
+    pids=[]; names=[]; cpus=[]; rss=[]  # parallel columns, one entry per process
     try:
-        output=subprocess.check_output("tasklist", shell=True)
-        for l in output.decode().splitlines()[3:]:
-            if l.strip()=="": continue
-            parts=l.split()
-            procs.append({"pid":parts[1],"name":parts[0]})
-        return procs[:20]
+        sync_proc_cache()
+        dead=[]
+        for pid,(p,name) in _proc_cache.items():
+            try:
+                with p.oneshot():  # batch the /proc reads for this process
+                    cpu=p.cpu_percent(None); mem=p.memory_info().rss
+            except psutil.NoSuchProcess: dead.append(pid); continue  # exited since psutil.pids()
+            except psutil.Error: continue
+            pids.append(pid); names.append(name); cpus.append(cpu); rss.append(mem)
+        for pid in dead: del _proc_cache[pid]
+        # Rank indices, then build (and round) dicts only for the rows that are actually sent
+        top=[{"pid":pids[i],"name":names[i],"cpu":round(cpus[i],1),"mem":round(rss[i]/MB,1)}
+             for i in heapq.nlargest(20,range(len(cpus)),key=cpus.__getitem__)]
+        _proc_list=(now,top)
+        return top
     except: return []
 
+def prime_counters():
+    """Record baselines for every delta-based reading so the first real sample has a full window"""
+    sync_proc_cache()
+    for p,_ in _proc_cache.values():
+        try: p.cpu_percent(None)  # the first call only records a baseline (and returns 0.0)
+        except psutil.Error: pass
+    get_cpu_usage(); get_disk_io(); get_net_io()
+
 def get_uptime():
     """Return uptime string"""
     try:
-        output=subprocess.check_output('wmic os get lastbootuptime /Value', shell=True)
-        boot_str=output.decode().split("=")[1].strip()
-        boot=datetime.strptime(boot_str[:14],"%Y%m%d%H%M%S")
-        uptime_sec=(datetime.now()-boot).total_seconds()
+        uptime_sec=time.time()-psutil.boot_time()
         h, rem = divmod(uptime_sec,3600); m,s=divmod(rem,60)
         return f"{int(h)}h {int(m)}m {int(s)}s"
     except: return "N/A"
 
+# ------------------------- CSV Auto-Log Writer -------------------------
+AUTO_LOG = "auto_log.csv"
+log_queue = queue.Queue(maxsize=1000)  # rows waiting for the writer thread
+_SENTINEL = object()                   # tells the writer thread to stop
+LOG_BATCH = 128                        # max rows per writerows() call
+LOG_BUFFER = 64*1024                   # file buffer size in bytes
+LOG_RETRY = 5.0                        # seconds between attempts after an open/write error
+log_stop = threading.Event()           # set at shutdown
+
+log_dropped = 0                        # rows discarded because the writer fell behind
+
+def log_row(row):
+    """Queue a row for the writer thread, dropping (and counting) the oldest row when the queue is full"""
+    global log_dropped
+    while True:
+        try: return log_queue.put_nowait(row)
+        except queue.Full:
+            try: log_queue.get_nowait()
+            except queue.Empty: continue
+            log_dropped+=1
+            print(f"Warning: auto-log writer is behind, {log_dropped} row(s) dropped so far")
+
+def log_writer():
+    """Run the auto-log writer, reporting open/write errors and retrying every LOG_RETRY seconds"""
+    while True:
+        try: return write_log_rows()
+        except OSError as e:  # e.g. file locked by Excel on Windows, unwritable directory, full disk
+            print(f"Warning: cannot write {AUTO_LOG} ({e}), retrying in {LOG_RETRY:.0f}s")
+            if log_stop.wait(LOG_RETRY): return
+
+def write_log_rows():
+    """Append queued rows to the auto-log CSV in batches, flushing at most once a second"""
+    with open(AUTO_LOG,"a",newline="",buffering=LOG_BUFFER) as f:
+        writer=csv.writer(f)
+        if f.tell()==0: writer.writerow(["Time"]+CSV_FIELDS)  # new/empty file; checked once, at open
+        last_flush=time.monotonic(); dirty=False
+        while True:
+            # Block until a row arrives; while rows sit unflushed, wake up to flush them
+            try: row=log_queue.get(timeout=1.0 if dirty else None)
+            except queue.Empty:
+                f.flush(); last_flush=time.monotonic(); dirty=False
+                continue
+            batch=[row]
+            while len(batch)<LOG_BATCH and batch[-1] is not _SENTINEL:
+                try: batch.append(log_queue.get_nowait())
+                except queue.Empty: break
+            if batch[-1] is _SENTINEL:
+                writer.writerows(batch[:-1])
+                break
+            writer.writerows(batch); dirty=True
+            if time.monotonic()-last_flush>1.0:
+                f.flush(); last_flush=time.monotonic(); dirty=False
+
+def stop_log_writer(thread):
+    """Unblock the writer thread and wait for it to finish writing queued rows"""
+    log_stop.set()  # ends a writer that is waiting to retry
+    if not thread.is_alive(): return
+    log_row(_SENTINEL)  # never blocks: drops the oldest row if the queue is full
+    thread.join(timeout=5)
+
 # ------------------------- Background Monitoring Thread -------------------------
+REFRESH_INTERVAL = 1.0          # seconds between samples
+LOG_INTERVAL = 10.0             # seconds between auto-log rows
+latest_data = None              # most recent sample collected by monitor()
+prev_data = {}                  # last sample emitted, so each update carries only changed fields
+HISTORY_LEN = 30                # points per chart, matches the browser
+HIST_KEYS = ("cpu","ram","disk_max","diskio","recv")  # sample fields plotted by the charts
+# Per-field float32 ring buffers sent to browsers when they connect; allocated once, written in place
+history = {k:array('f',bytes(4*HISTORY_LEN)) for k in HIST_KEYS}
+hist_idx = 0                    # next ring-buffer slot to write
+hist_full = False               # True once every slot has been written
+hist_lock = threading.Lock()    # makes monitor()'s history write + emit atomic w.r.t. on_connect's snapshot
+stop_event = threading.Event()  # set on shutdown to wake monitor() and end its loop
+clients = set()                 # Socket.IO session ids of connected browsers
+
+def collect_data():
+    """Collect one sample of every metric"""
+    disk,disk_max=get_disk_usage()
+    recv,sent=get_net_io()
+    return {
+        "cpu": get_cpu_usage(),
+        "ram": get_ram_usage(),
+        "disk": disk,
+        "disk_max": disk_max,  # fullest drive; drives the disk chart and alert colour
+        "diskio": get_disk_io(),
+        "recv": recv,
+        "sent": sent,
+        "processes": get_process_list() if clients else [],  # only the page shows processes
+        "uptime": get_uptime()
+    }
+
+def hist_snapshot():
+    """Return (points per field, raw float32 bytes of each HIST_KEYS field oldest first, back to back)"""
+    idx,full=hist_idx,hist_full
+    ordered=[(h[idx:]+h[:idx]) if full else h[:idx] for h in (history[k] for k in HIST_KEYS)]
+    return (HISTORY_LEN if full else idx),b"".join(h.tobytes() for h in ordered)
+
+CSV_FIELDS = ["CPU","RAM","Disk","DiskIO","NetIO","Uptime"]
+
+def csv_fields(d):
+    """Return the CSV_FIELDS columns for a sample"""
+    return [d["cpu"],d["ram"],d["disk"],f"{d['diskio']:.2f} B/s",
+            f"Received: {d['recv']:.2f} B/s Sent: {d['sent']:.2f} B/s",d["uptime"]]
+
 def monitor():
     """Continuously collect system data, emit to frontend, auto-log CSV"""
-    while True:
-        data = {
-            "cpu": get_cpu_usage(),
-            "ram": get_ram_usage(),
-            "disk": get_disk_usage(),
-            "diskio": get_disk_io(),
-            "netio": get_net_io(),
-            "processes": get_process_list(),
-            "uptime": get_uptime()
-        }
-        # Emit to frontend
-        socketio.emit('update', data)
+    global latest_data, prev_data, hist_idx, hist_full
+    # First sample one interval after prime_counters(); wakes at once on shutdown
+    next_tick=next_log=time.monotonic()+REFRESH_INTERVAL
+    while not stop_event.wait(next_tick-time.monotonic()):
+        data = collect_data()
+        # History write and emit happen as one step with respect to on_connect: a browser either gets
+        # this sample in its snapshot or as its next update, never both (duplicate point) or neither
+        with hist_lock:
+            latest_data = data
+            for k in HIST_KEYS: history[k][hist_idx]=data[k]
+            hist_idx=(hist_idx+1)%HISTORY_LEN
+            hist_full=hist_full or hist_idx==0
+            # Emit only the fields that changed; the browser merges them into its own state.
+            # An empty update is still sent so the charts advance by one point. Nobody watching: emit nothing.
+            if clients: socketio.emit('update', {k:v for k,v in data.items() if prev_data.get(k)!=v})
+            prev_data = data
+
+        # Auto-logging CSV every LOG_INTERVAL seconds (handed to the writer thread, never blocks on disk)
+        if time.monotonic()>=next_log:
+            next_log=max(next_log+LOG_INTERVAL,time.monotonic())  # no catch-up burst after a stall
+            log_row([datetime.now()]+csv_fields(data))
+
+        # Sleep until the next tick rather than a full interval after the work
+        next_tick=max(next_tick+REFRESH_INTERVAL,time.monotonic())
 
-        # Auto-logging CSV every 10 seconds
-        if int(time.time()) % 10 == 0:
-            with open("auto_log.csv","a",newline="") as f:
-                writer=csv.writer(f)
-                writer.writerow([datetime.now(),data["cpu"],data["ram"],data["disk"],data["diskio"],data["netio"],data["uptime"]])
-        time.sleep(1)
+def stop_monitor(thread):
+    """Wake the monitor thread from its sleep and wait for it to exit"""
+    stop_event.set()
+    thread.join(timeout=5)
+
+# ------------------------- SocketIO Events -------------------------
+@socketio.on('connect')
+def on_connect():
+    """Send a newly connected browser the chart history and full latest sample; later updates are deltas"""
+    with hist_lock:
+        clients.add(request.sid)
+        n,blob=hist_snapshot()  # sent as a binary attachment, not a JSON array
+        emit('snapshot', {"keys": HIST_KEYS, "len": n, "data": blob, "latest": latest_data})
+
+@socketio.on('disconnect')
+def on_disconnect(*args):
+    """Forget a browser that went away"""
+    clients.discard(request.sid)
 
 # ------------------------- Routes -------------------------
+@app.after_request
+def cache_vendor_files(response):
+    """Let browsers keep vendored libraries without revalidating (successful responses only)"""
+    if request.path.startswith('/static/vendor/') and response.status_code in (200,304):
+        response.headers['Cache-Control']='public, max-age=31536000, immutable'
+    return response
+
 @app.route('/')
-def index(): return render_template_string(HTML)
+def index(): return INDEX_HTML,{"Cache-Control":"public, max-age=60"}
 
 @app.route('/export_csv')
 def export_csv():
     """Export current metrics as CSV"""
     filename="system_report.csv"
-    fields=["CPU","RAM","Disk","DiskIO","NetIO","Uptime"]
-    data=[[get_cpu_usage(),get_ram_usage(),get_disk_usage(),get_disk_io(),get_net_io(),get_uptime()]]
+    # Reuse the monitor's latest sample; sampling again here would reset the CPU and I/O rate baselines
+    d=latest_data or collect_data()
+    data=[csv_fields(d)]
     with open(filename,'w',newline='') as f:
         writer=csv.writer(f)
-        writer.writerow(fields)
+        writer.writerow(CSV_FIELDS)
         writer.writerows(data)
     return send_file(filename,as_attachment=True)
 
 # ------------------------- Run App -------------------------
 if __name__=="__main__":
-    threading.Thread(target=monitor,daemon=True).start()
+    writer_thread=threading.Thread(target=log_writer,daemon=True)
+    writer_thread.start()
+    atexit.register(stop_log_writer,writer_thread)
+    prime_counters()
+    monitor_thread=threading.Thread(target=monitor,daemon=True)
+    monitor_thread.start()
+    atexit.register(stop_monitor,monitor_thread)  # atexit runs LIFO: monitor stops before the writer
     socketio.run(app,debug=True)
 
 